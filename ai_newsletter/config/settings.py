@@ -182,6 +182,7 @@ SYSTEM_SETTINGS = {
     "log_level": os.getenv('LOG_LEVEL', 'INFO'),
     "max_retries": 3,                      # Maximum number of retries for failed API requests
     "retry_delay": 1,                      # Delay between retries in seconds
+    "max_fetch_workers": 4,                # Concurrent GNews category queries
     "use_central_timezone": True,          # Whether to convert all dates to Central Time
     "default_timezone": "America/Chicago", # Default timezone for date standardization
 }
@@ -11,6 +11,8 @@ import ssl
 import certifi
 from ai_newsletter.config.settings import EMAIL_SETTINGS
 import time
+import re
+from functools import lru_cache
 from socket import error as socket_error
 from datetime import datetime
 from dateutil import tz as dateutil_tz
@@ -27,10 +29,14 @@ MAX_RETRIES = 3
 RETRY_DELAY = 5
 KEEPALIVE_INTERVAL = 60
 SMTP_TIMEOUT = 60
+SMTP_MIN_TIMEOUT = 15
 
 # Define Central timezone
 CENTRAL = dateutil_tz.gettz("America/Chicago")
 
+# Script and style blocks carry no readable text; drop them before parsing
+NON_TEXT_BLOCK_PATTERN = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
 def setup_email_settings():
     """Initialize email settings from environment variables"""
     return {
@@ -42,8 +48,9 @@ def setup_email_settings():
         'to_email': os.getenv('RECIPIENT_EMAIL'),
     }
 
+@lru_cache(maxsize=1)
 def create_secure_smtp_context():
-    """Create a secure SSL context for SMTP"""
+    """Create a secure SSL context for SMTP, built once and shared by all connections"""
     context = ssl.create_default_context(
         purpose=ssl.Purpose.SERVER_AUTH,
         cafile=certifi.where()
@@ -57,14 +64,17 @@ def create_smtp_connection(smtp_settings):
     retry_count = 0
     while retry_count < MAX_RETRIES:
         try:
-            context = create_secure_smtp_context()
-            
             server = smtplib.SMTP_SSL(
                 smtp_settings['smtp_server'],
                 smtp_settings['smtp_port'],
-                timeout=SMTP_TIMEOUT,
-                context=context
+                # Halve the connect timeout on each retry so a dead server
+                # can't hold the send for MAX_RETRIES full timeouts
+                timeout=max(SMTP_MIN_TIMEOUT, SMTP_TIMEOUT // (2 ** retry_count)),
+                context=create_secure_smtp_context()
             )
+            # The constructor timeout stays on the socket for the whole
+            # session; give login and the DATA exchange the full timeout
+            server.sock.settimeout(SMTP_TIMEOUT)
             
             server.login(smtp_settings['smtp_user'], smtp_settings['smtp_pass'])
             return server
@@ -100,18 +110,17 @@ def strip_html(html_content: str) -> str:
     if not html_content:
         return ""
     
+    # Strip the newsletter's large <style> head before the parser builds nodes for it
+    html_content = NON_TEXT_BLOCK_PATTERN.sub(' ', html_content)
     soup = BeautifulSoup(html_content, 'html.parser')
     
-    # Remove script and style elements
+    # Remove any script and style elements the pattern could not match
     for script in soup(["script", "style"]):
         script.decompose()
     
     # Get text while preserving structure
     lines = []
     for element in soup.descendants:
-        if element.parent and element.parent.name in ['style', 'script']:
-            continue
-            
         if element.name == 'p':
             lines.append("\n\n")
         elif element.name == 'br':
@@ -1,9 +1,12 @@
 """Main module for fetching news articles from GNews API."""
 import time
 import logging
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Tuple, Any
-from dateutil import parser as dateutil_parser, tz as dateutil_tz
+from typing import List, Dict, Tuple, Any, Optional
+from dateutil import tz as dateutil_tz
 from ai_newsletter.logging_cfg.logger import setup_logger
 from ai_newsletter.config.settings import (
     SYSTEM_SETTINGS,
@@ -11,7 +14,9 @@ from ai_newsletter.config.settings import (
     GNEWS_DAILY_LIMIT,
     GNEWS_REQUEST_DELAY
 )
+from ai_newsletter.core.constants import AgeCategory
 from ai_newsletter.feeds.gnews_client import GNewsAPI, GNewsAPIError
+from ai_newsletter.formatting.date_utils import parse_published_date
 
 # Initialize logger
 logger = setup_logger()
@@ -27,6 +32,50 @@ FETCH_METRICS = {
     'filtered_old_articles': 0  # New metric to track filtered articles
 }
 
+# Article age buckets: AGE_THRESHOLDS holds the exclusive upper bound in
+# seconds of each label in AGE_CATEGORIES; anything older is the last label
+AGE_THRESHOLDS = (
+    timedelta(hours=6).total_seconds(),
+    timedelta(hours=24).total_seconds(),
+    timedelta(days=2).total_seconds(),
+    timedelta(days=7).total_seconds()
+)
+AGE_CATEGORIES = tuple(category.value for category in AgeCategory)
+
+# Start time of the most recent GNews request, shared by the fetch workers
+_request_lock = threading.Lock()
+_last_request_start = 0.0
+
+def wait_for_request_slot() -> None:
+    """
+    Block until GNEWS_REQUEST_DELAY has passed since the last request started.
+    
+    Worker threads call this right before their request, so request start
+    times stay spaced however many queries are queued at once.
+    """
+    global _last_request_start
+    with _request_lock:
+        delay = _last_request_start + GNEWS_REQUEST_DELAY - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _last_request_start = time.monotonic()
+
+def reset_fetch_metrics() -> None:
+    """Start a fetch run with fresh metrics.
+    
+    Replaces the per-run containers rather than clearing them, so stats
+    dictionaries returned by earlier runs are not mutated.
+    """
+    FETCH_METRICS.update({
+        'start_time': None,
+        'processing_time': 0,
+        'total_articles': 0,
+        'articles_per_category': {},
+        'failed_queries': [],
+        'empty_queries': [],
+        'filtered_old_articles': 0
+    })
+
 def safe_fetch_news_articles(**kwargs) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Safe wrapper around fetch_articles_from_all_feeds with parameter validation.
@@ -62,12 +111,14 @@ def safe_fetch_news_articles(**kwargs) -> Tuple[List[Dict[str, Any]], Dict[str,
         logger.error(f"Error in safe_fetch_news_articles: {str(e)}")
         return [], {"error": str(e)}
 
-def categorize_article_age(published_date: datetime) -> str:
+def categorize_article_age(published_date: datetime, now: Optional[datetime] = None) -> str:
     """
     Categorizes article age relative to now.
     
     Args:
         published_date: The article's publication date (timezone-aware)
+        now: Reference time; pass one value when categorizing a batch so
+            the clock is read once instead of per article
         
     Returns:
         str: Age category ('Breaking', 'Today', 'Yesterday', 'This Week', or 'Older')
@@ -75,19 +126,40 @@ def categorize_article_age(published_date: datetime) -> str:
     if not published_date.tzinfo:
         published_date = published_date.replace(tzinfo=timezone.utc)
         
-    now = datetime.now(timezone.utc)
-    age = now - published_date
-    
-    if age < timedelta(hours=6):
-        return 'Breaking'
-    elif age < timedelta(hours=24):
-        return 'Today'
-    elif age < timedelta(days=2):
-        return 'Yesterday'
-    elif age < timedelta(days=7):
-        return 'This Week'
-    else:
-        return 'Older'
+    if now is None:
+        now = datetime.now(timezone.utc)
+    age_seconds = (now - published_date).total_seconds()
+    return AGE_CATEGORIES[bisect_right(AGE_THRESHOLDS, age_seconds)]
+
+def categorize_article_ages(articles: List[Dict[str, Any]], now: Optional[datetime] = None) -> None:
+    """
+    Set age_category on each article that has a parsed published_dt.
+    
+    Reads the clock once for the whole batch, so every article is aged
+    against the same reference time.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    for article in articles:
+        published_dt = article.get('published_dt')
+        if published_dt is not None:
+            article['age_category'] = categorize_article_age(published_dt, now=now)
+
+# Keywords indicating major international stories
+MAJOR_STORY_KEYWORDS = (
+    'global', 'worldwide', 'international', 'crisis', 'summit', 
+    'pandemic', 'climate', 'war', 'peace', 'treaty', 'united nations',
+    'world health', 'global economy', 'international trade',
+    'humanitarian', 'nuclear', 'diplomatic', 'g20', 'g7', 'nato',
+    'security council', 'economic crisis', 'global market'
+)
+
+# Keywords indicating local/minor stories to filter out
+LOCAL_STORY_KEYWORDS = (
+    'local police', 'arrested', 'minor incident', 'local council',
+    'neighborhood', 'city council', 'municipal', 'local resident',
+    'small business', 'traffic accident', 'petty crime'
+)
 
 def is_major_international_story(article: Dict[str, Any]) -> bool:
     """
@@ -102,29 +174,65 @@ def is_major_international_story(article: Dict[str, Any]) -> bool:
     description = article.get('description', '').lower()
     content = f"{title} {description}"
     
-    # Keywords indicating major international stories
-    major_keywords = [
-        'global', 'worldwide', 'international', 'crisis', 'summit', 
-        'pandemic', 'climate', 'war', 'peace', 'treaty', 'united nations',
-        'world health', 'global economy', 'international trade',
-        'humanitarian', 'nuclear', 'diplomatic', 'g20', 'g7', 'nato',
-        'security council', 'economic crisis', 'global market'
-    ]
+    # Most articles have no major keyword, so check that first and skip
+    # the local-keyword scan entirely when it fails
+    if not any(keyword in content for keyword in MAJOR_STORY_KEYWORDS):
+        return False
     
-    # Keywords indicating local/minor stories to filter out
-    local_keywords = [
-        'local police', 'arrested', 'minor incident', 'local council',
-        'neighborhood', 'city council', 'municipal', 'local resident',
-        'small business', 'traffic accident', 'petty crime'
+    # Check if any local keywords are present
+    return not any(keyword in content for keyword in LOCAL_STORY_KEYWORDS)
+
+def fetch_category_articles(gnews: GNewsAPI, category: str) -> Tuple[List[Dict[str, Any]], str, bool]:
+    """
+    Run the GNews query for a single news category.
+    
+    Runs in a worker thread and only does the network call; filtering and
+    metrics are left to the caller on the main thread.
+    
+    Returns:
+        tuple: (raw articles, query used, whether the query failed)
+    """
+    query = f"({category}) AND (global OR international OR worldwide)"
+    try:
+        wait_for_request_slot()
+        return gnews.search_news(query), query, False
+    except Exception as e:
+        logger.error(f"Error fetching {category} news: {e}")
+        return [], query, True
+
+def filter_category_articles(articles: List[Dict[str, Any]], category: str, query: str) -> List[Dict[str, Any]]:
+    """Keep the major international stories from a category query and tag them."""
+    filtered_articles = [
+        article for article in articles
+        if is_major_international_story(article)
     ]
     
-    # Check if any major keywords are present
-    has_major_keywords = any(keyword in content for keyword in major_keywords)
+    # Add metadata
+    for article in filtered_articles:
+        article['newsletter_category'] = category.upper()
+        article['query_matched'] = query
     
-    # Check if any local keywords are present
-    has_local_keywords = any(keyword in content for keyword in local_keywords)
+    return filtered_articles
+
+def annotate_published_dates(articles: List[Dict[str, Any]]) -> None:
+    """
+    Parse each article's published_at once and store it as published_dt.
     
-    return has_major_keywords and not has_local_keywords
+    Sorting and date filtering read the aware datetime instead of parsing
+    the string again. Articles with a missing or unparseable date get none.
+    """
+    for article in articles:
+        published_at = article.get('published_at')
+        if not published_at:
+            continue
+        try:
+            published_dt = parse_published_date(published_at)
+        except (TypeError, ValueError, OverflowError):
+            logger.warning(f"Could not parse date: {published_at}")
+            continue
+        if published_dt.tzinfo is None:
+            published_dt = published_dt.replace(tzinfo=timezone.utc)
+        article['published_dt'] = published_dt
 
 def fetch_articles_by_category() -> List[Dict[str, Any]]:
     """Fetch articles for each news category."""
@@ -133,58 +241,63 @@ def fetch_articles_by_category() -> List[Dict[str, Any]]:
     
     # First, get top headlines
     try:
+        wait_for_request_slot()  # Respect API rate limits
         top_headlines = gnews.get_top_headlines()
         for article in top_headlines:
             article['newsletter_category'] = 'TOP_HEADLINES'
             article['query_matched'] = 'top_headlines'
         articles.extend(top_headlines)
-        time.sleep(GNEWS_REQUEST_DELAY)  # Respect API rate limits
     except Exception as e:
         logger.error(f"Error fetching top headlines: {e}")
         FETCH_METRICS['failed_queries'].append('TOP_HEADLINES:top_headlines')
 
-    # Then fetch category-specific articles
-    for category in NEWS_CATEGORIES:
-        try:
-            query = f"({category}) AND (global OR international OR worldwide)"
-            category_articles = gnews.search_news(query)
-            
-            # Filter for major international stories
-            filtered_articles = [
-                article for article in category_articles
-                if is_major_international_story(article)
-            ]
-            
-            # Add metadata
-            for article in filtered_articles:
-                article['newsletter_category'] = category.upper()
-                article['query_matched'] = query
-            
-            articles.extend(filtered_articles)
-            
-            # Update metrics
-            FETCH_METRICS['articles_per_category'][category] = len(filtered_articles)
-            
-            if not filtered_articles:
+    # Then fetch category-specific articles concurrently. Each worker waits
+    # for its request slot, so start times stay spaced by GNEWS_REQUEST_DELAY
+    # while slow responses overlap. More workers than queries would only sit idle
+    max_workers = max(1, min(SYSTEM_SETTINGS.get('max_fetch_workers', 4), len(NEWS_CATEGORIES)))
+    category_results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_category_articles, gnews, category): category
+            for category in NEWS_CATEGORIES
+        }
+        
+        # All queries are submitted up front and paced inside the workers, so
+        # draining starts right away: each result is filtered here as soon as
+        # it finishes, while later queries are still waiting or in flight
+        for future in as_completed(futures):
+            category = futures[future]
+            raw_articles, query, failed = future.result()
+            if not failed:
+                try:
+                    category_articles = filter_category_articles(raw_articles, category, query)
+                except Exception as e:
+                    logger.error(f"Error filtering {category} news: {e}")
+                    failed = True
+            if failed:
+                FETCH_METRICS['failed_queries'].append(f"{category}:{query}")
+                continue
+            FETCH_METRICS['articles_per_category'][category] = len(category_articles)
+            if not category_articles:
                 FETCH_METRICS['empty_queries'].append(f"{category}:{query}")
-            
-            time.sleep(GNEWS_REQUEST_DELAY)
-            
-        except Exception as e:
-            logger.error(f"Error fetching {category} news: {e}")
-            FETCH_METRICS['failed_queries'].append(f"{category}:{query}")
+            category_results[category] = category_articles
+    
+    # Combine in category order so URL dedup keeps the same copy every run
+    for category in NEWS_CATEGORIES:
+        articles.extend(category_results.get(category, []))
 
     # Remove duplicates based on URL
-    unique_articles = {article['url']: article for article in articles}.values()
+    unique_articles = list({article['url']: article for article in articles}.values())
+    annotate_published_dates(unique_articles)
+    categorize_article_ages(unique_articles)
     
-    # Sort by date (most recent first)
-    sorted_articles = sorted(
+    # Sort by date (most recent first); sorted() already returns a new list
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(
         unique_articles,
-        key=lambda x: dateutil_parser.parse(x['published_at']) if x.get('published_at') else datetime.min.replace(tzinfo=timezone.utc),
+        key=lambda x: x.get('published_dt') or oldest,
         reverse=True
     )
-    
-    return list(sorted_articles)
 
 def fetch_articles_from_all_feeds(max_articles_per_source: int = 5) -> Tuple[List[Dict], Dict]:
     """
@@ -197,6 +310,7 @@ def fetch_articles_from_all_feeds(max_articles_per_source: int = 5) -> Tuple[Lis
         tuple: (list of articles, fetch statistics dictionary)
     """
     logger.info("Starting news fetch process...")
+    reset_fetch_metrics()
     FETCH_METRICS['start_time'] = time.time()
 
     try:
@@ -2,9 +2,11 @@
 from typing import List, Dict
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-from dateutil import parser, tz
+from dateutil import tz
 from ai_newsletter.core.types import Article
 from ai_newsletter.core.constants import NEWS_SOURCE_CATEGORIES
+from ai_newsletter.formatting.date_utils import parse_published_date
+from ai_newsletter.formatting.deduplication import normalize_text
 from ai_newsletter.logging_cfg.logger import setup_logger
 
 logger = setup_logger()
@@ -29,21 +31,25 @@ def filter_articles_by_date(articles: List[Article], start_date=None, end_date=N
         end_date = end_date.astimezone(CENTRAL)
 
     filtered = []
+    missing_dates = 0
+    unparseable_dates = 0
     for article in articles:
-        publish_date = article.get('published_at', '')
+        # Prefer the datetime parsed once at fetch time
+        publish_date = article.get('published_dt') or article.get('published_at', '')
         if not publish_date:
+            missing_dates += 1
             continue
 
         # Parse and normalize date
         try:
-            if isinstance(publish_date, str):
-                publish_date = parser.parse(publish_date)
+            publish_date = parse_published_date(publish_date)
+            # Aware datetimes compare by instant, so only naive dates need
+            # a zone; there is no need to convert each one to CENTRAL
             if publish_date.tzinfo is None:
-                publish_date = publish_date.replace(tzinfo=tz.UTC).astimezone(CENTRAL)
-            elif publish_date.tzinfo != CENTRAL:
-                publish_date = publish_date.astimezone(CENTRAL)
-        except (ValueError, AttributeError):
-            logger.warning(f"Could not parse date: {publish_date}")
+                publish_date = publish_date.replace(tzinfo=tz.UTC)
+        except (TypeError, ValueError, AttributeError, OverflowError):
+            logger.debug(f"Could not parse date: {publish_date}")
+            unparseable_dates += 1
             continue
 
         # Apply date filters
@@ -53,15 +59,19 @@ def filter_articles_by_date(articles: List[Article], start_date=None, end_date=N
             continue
         filtered.append(article)
 
+    # One summary line instead of a log record per article
+    logger.info(
+        f"Date filter kept {len(filtered)}/{len(articles)} articles "
+        f"(missing date: {missing_dates}, unparseable: {unparseable_dates}, "
+        f"outside window: {len(articles) - len(filtered) - missing_dates - unparseable_dates})"
+    )
+    if unparseable_dates:
+        logger.warning(f"Could not parse the publish date of {unparseable_dates} articles")
+
     return filtered
 
 def is_duplicate(article1: Article, article2: Article, title_threshold: float = 0.8) -> bool:
     """Detect duplicate articles using title and description similarity."""
-    def normalize_text(text: str) -> str:
-        if not text:
-            return ""
-        return " ".join(text.lower().split())
-    
     # Compare URLs first
     if article1.get('url') == article2.get('url'):
         return True
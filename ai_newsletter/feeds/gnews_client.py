@@ -1,7 +1,9 @@
 import os
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -11,6 +13,23 @@ import gnews
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def get_country_names() -> Tuple[str, ...]:
+    """Return lowercase English country names, loaded once per process."""
+    from country_list import countries_for_language
+    return tuple(name.lower() for _, name in countries_for_language('en'))
+
+# Word tokens, used to match single-word country names as whole words
+WORD_PATTERN = re.compile(r'\w+')
+
+@lru_cache(maxsize=1)
+def get_country_name_index() -> Tuple[frozenset, Tuple[str, ...]]:
+    """Split country names into single-word names and multi-word phrases."""
+    names = get_country_names()
+    single_words = frozenset(name for name in names if WORD_PATTERN.fullmatch(name))
+    phrases = tuple(name for name in names if not WORD_PATTERN.fullmatch(name))
+    return single_words, phrases
+
 class GNewsAPIError(Exception):
     """Custom exception for GNews API errors."""
     pass
@@ -47,6 +66,8 @@ class GNewsAPI:
             'WHO',
             'global impact'
         ]
+        # Lowercased once here instead of on every is_major_story call
+        self._major_keywords_lower = tuple(keyword.lower() for keyword in self.major_keywords)
 
     def search_news(self, query: str) -> List[Dict[str, Any]]:
         """Search for news articles using a query."""
@@ -71,15 +92,21 @@ class GNewsAPI:
         content = f"{title} {description}"
         
         # Check if contains major keywords
-        if any(keyword.lower() in content for keyword in self.major_keywords):
+        if any(keyword in content for keyword in self._major_keywords_lower):
             return True
             
-        # Check if multiple countries are mentioned (indicates international scope)
-        from country_list import countries_for_language
-        countries = dict(countries_for_language('en')).values()
-        country_mentions = sum(1 for country in countries if country.lower() in content)
+        # Check if multiple countries are mentioned (indicates international scope).
+        # Single-word names are matched as whole tokens with one set
+        # intersection, so "oman" no longer matches inside "woman".
+        single_words, phrases = get_country_name_index()
+        country_mentions = len(single_words.intersection(WORD_PATTERN.findall(content)))
         if country_mentions >= 2:
             return True
+        for phrase in phrases:
+            if phrase in content:
+                country_mentions += 1
+                if country_mentions >= 2:
+                    return True
             
         return False
 
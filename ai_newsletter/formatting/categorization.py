@@ -1,5 +1,7 @@
 """Article categorization functions."""
 from typing import Dict
+from ai_newsletter.core.constants import NEWS_SOURCE_CATEGORIES
+from ai_newsletter.formatting.text_utils import compile_keyword_pattern
 
 # Updated categories based on RSS feed structure
 SECTION_CATEGORIES = {
@@ -15,6 +17,40 @@ SECTION_CATEGORIES = {
     'LOCAL': 'Local News'
 }
 
+SECTION_DESCRIPTIONS = {
+    'US_NEWS': 'Top domestic news stories from across the United States.',
+    'WORLD_NEWS': 'Major international events and global developments.',
+    'POLITICS': 'The latest political news, policy updates, and government affairs.',
+    'TECHNOLOGY': 'Breaking tech news, digital trends, and innovation.',
+    'BUSINESS': 'Business headlines, economic updates, and market news.',
+    'LEFT_LEANING': 'News from sources that tend to have a center-left perspective.',
+    'CENTER': 'News from sources that aim for balanced, centrist coverage.',
+    'RIGHT_LEANING': 'News from sources that tend to have a center-right perspective.',
+    'PERSONALIZED': 'Stories selected based on your personal interests and preferences.',
+    'LOCAL': 'News from your local area that may directly affect your community.'
+}
+
+# One compiled pattern per source category, checked in declaration order.
+# Names are brand prefixes ("abc" in "ABC7 Chicago"); only two-letter names
+# like "ap" must be whole words so they do not hit "AppleInsider".
+SOURCE_CATEGORY_PATTERNS = [
+    (category, compile_keyword_pattern(names, whole_word_max_len=2))
+    for category, names in NEWS_SOURCE_CATEGORIES.items()
+]
+
+# Content keywords per category, checked in order after the source match
+CONTENT_CATEGORY_KEYWORDS = [
+    ('WORLD_NEWS', ['international', 'global', 'worldwide', 'foreign', 'abroad']),
+    ('POLITICS', ['president', 'congress', 'senate', 'governor', 'election', 'campaign', 'government']),
+    ('TECHNOLOGY', ['tech', 'technology', 'software', 'app', 'digital', 'ai', 'artificial intelligence']),
+    ('BUSINESS', ['business', 'economy', 'market', 'stock', 'company', 'entrepreneur', 'ceo'])
+]
+
+CONTENT_CATEGORY_PATTERNS = [
+    (category, compile_keyword_pattern(keywords))
+    for category, keywords in CONTENT_CATEGORY_KEYWORDS
+]
+
 def categorize_article(article: Dict) -> str:
     """
     Categorize an article based on its source and GNews metadata.
@@ -32,44 +68,18 @@ def categorize_article(article: Dict) -> str:
     combined_text = f"{title} {description}"
     
     # First, categorize based on source name
-    if any(s in source_name for s in ['cnn', 'msnbc', 'nyt', 'new york times', 'washington post']):
-        return 'LEFT_LEANING'
-    elif any(s in source_name for s in ['fox', 'national review', 'newsmax', 'washington examiner']):
-        return 'RIGHT_LEANING'
-    elif any(s in source_name for s in ['npr', 'reuters', 'ap', 'associated press', 'pbs', 'abc', 'cbs']):
-        return 'CENTER'
-    elif any(s in source_name for s in ['bbc', 'al jazeera', 'france24', 'dw', 'guardian world']):
-        return 'WORLD_NEWS'
-    elif any(s in source_name for s in ['techcrunch', 'wired', 'ars technica', 'technology review']):
-        return 'TECHNOLOGY'
-    elif any(s in source_name for s in ['tennessean', 'nashville', 'tennessee']):
-        return 'LOCAL'
+    for category, pattern in SOURCE_CATEGORY_PATTERNS:
+        if pattern.search(source_name):
+            return category
     
     # Then, categorize based on content keywords
-    if any(kw in combined_text for kw in ['international', 'global', 'worldwide', 'foreign', 'abroad']):
-        return 'WORLD_NEWS'
-    elif any(kw in combined_text for kw in ['president', 'congress', 'senate', 'governor', 'election', 'campaign', 'government']):
-        return 'POLITICS'
-    elif any(kw in combined_text for kw in ['tech', 'technology', 'software', 'app', 'digital', 'ai', 'artificial intelligence']):
-        return 'TECHNOLOGY'
-    elif any(kw in combined_text for kw in ['business', 'economy', 'market', 'stock', 'company', 'entrepreneur', 'ceo']):
-        return 'BUSINESS'
+    for category, pattern in CONTENT_CATEGORY_PATTERNS:
+        if pattern.search(combined_text):
+            return category
     
     # Default to U.S. News if nothing else matches
     return 'US_NEWS'
 
 def get_section_description(section_key: str) -> str:
     """Generate a description for each section."""
-    descriptions = {
-        'US_NEWS': 'Top domestic news stories from across the United States.',
-        'WORLD_NEWS': 'Major international events and global developments.',
-        'POLITICS': 'The latest political news, policy updates, and government affairs.',
-        'TECHNOLOGY': 'Breaking tech news, digital trends, and innovation.',
-        'BUSINESS': 'Business headlines, economic updates, and market news.',
-        'LEFT_LEANING': 'News from sources that tend to have a center-left perspective.',
-        'CENTER': 'News from sources that aim for balanced, centrist coverage.',
-        'RIGHT_LEANING': 'News from sources that tend to have a center-right perspective.',
-        'PERSONALIZED': 'Stories selected based on your personal interests and preferences.',
-        'LOCAL': 'News from your local area that may directly affect your community.'
-    }
-    return descriptions.get(section_key, '')
\ No newline at end of file
+    return SECTION_DESCRIPTIONS.get(section_key, '')
\ No newline at end of file
@@ -1,4 +1,5 @@
 """HTML components for newsletter articles."""
+import hashlib
 from typing import Dict
 from ai_newsletter.core.types import Article
 from ai_newsletter.logging_cfg.logger import setup_logger
@@ -11,7 +12,9 @@ def format_summary_block(article: Article) -> str:
     if not summary:
         return ''
     
-    article_id = f"article-{hash(article['url'])}"
+    # blake2b is fast and, unlike hash(), stable across interpreter runs
+    url_digest = hashlib.blake2b(article['url'].encode(), digest_size=8).hexdigest()
+    article_id = f"article-{url_digest}"
     
     return f"""
         <div class="article-summary">
@@ -1,8 +1,11 @@
 """Date handling utilities."""
 from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
 from dateutil import parser, tz as dateutil_tz
 from bs4 import BeautifulSoup
+import soupsieve
 import re
 from urllib.parse import urlparse
 from ai_newsletter.logging_cfg.logger import setup_logger
@@ -13,6 +16,60 @@ logger = setup_logger()
 # Define Central timezone
 CENTRAL = dateutil_tz.gettz("America/Chicago")
 
+# Day-level format used for every date shown in the newsletter
+DISPLAY_DATE_FORMAT = "%B %d, %Y"
+
+# Metadata patterns in priority order: (CSS selector, attribute, confidence)
+DATE_META_PATTERNS = [
+    ('meta[property="article:published_time"]', 'content', 0.9),
+    ('meta[property="og:article:published_time"]', 'content', 0.9),
+    ('meta[name="publishedDate"]', 'content', 0.9),
+    ('meta[name="date"]', 'content', 0.8),
+    ('meta[name="article:published"]', 'content', 0.8),
+    ('time[datetime]', 'datetime', 0.8),
+    ('time[class*="publish"]', 'datetime', 0.7),
+    ('.article-date', 'content', 0.6),
+    ('.published-date', 'content', 0.6)
+]
+
+# Compile once so a single combined query replaces one tree walk per pattern
+_DATE_META_SELECTOR = soupsieve.compile(', '.join(sel for sel, _, _ in DATE_META_PATTERNS))
+_DATE_META_MATCHERS = [
+    (soupsieve.compile(sel), attr, confidence)
+    for sel, attr, confidence in DATE_META_PATTERNS
+]
+
+def parse_published_date(value) -> datetime:
+    """
+    Parse an article publish date, trying the cheap exact formats first.
+    
+    ISO 8601 and RFC 822 (the GNews "Mon, 01 Jan 2024 12:00:00 GMT" style)
+    are handled by the C-level stdlib parsers; anything else falls back to
+    the much slower but more forgiving dateutil parser.
+    
+    Raises:
+        ValueError: If the value cannot be parsed as a date
+        TypeError: If the value is neither a string nor a datetime
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _parse_date_string(value)
+    raise TypeError(f"Cannot parse date from {type(value).__name__}")
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> datetime:
+    """Parse a date string; cached because articles often share timestamps."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+    return parser.parse(value)
+
 def extract_date_from_metadata(html_content: str) -> Tuple[Optional[str], float]:
     """Extract publication date from HTML metadata tags."""
     if not html_content:
@@ -20,21 +77,13 @@ def extract_date_from_metadata(html_content: str) -> Tuple[Optional[str], float]
     
     soup = BeautifulSoup(html_content, 'html.parser')
     
-    # Common metadata patterns
-    meta_patterns = [
-        ('meta[property="article:published_time"]', 'content', 0.9),
-        ('meta[property="og:article:published_time"]', 'content', 0.9),
-        ('meta[name="publishedDate"]', 'content', 0.9),
-        ('meta[name="date"]', 'content', 0.8),
-        ('meta[name="article:published"]', 'content', 0.8),
-        ('time[datetime]', 'datetime', 0.8),
-        ('time[class*="publish"]', 'datetime', 0.7),
-        ('.article-date', 'content', 0.6),
-        ('.published-date', 'content', 0.6)
-    ]
+    # Walk the document once, then rank candidates by pattern priority
+    candidates = _DATE_META_SELECTOR.select(soup)
+    if not candidates:
+        return None, 0.0
     
-    for selector, attr, confidence in meta_patterns:
-        element = soup.select_one(selector)
+    for matcher, attr, confidence in _DATE_META_MATCHERS:
+        element = next((el for el in candidates if matcher.match(el)), None)
         if element:
             date_str = element.get(attr)
             if date_str:
@@ -78,17 +127,17 @@ def format_date(article: Union[Dict, str]) -> Tuple[str, Dict]:
         metadata['original_date'] = article
         if not article:
             logger.warning("Empty date string provided")
-            return datetime.now(CENTRAL).strftime("%B %d, %Y"), metadata
+            return datetime.now(CENTRAL).strftime(DISPLAY_DATE_FORMAT), metadata
         
         try:
-            parsed_date = parser.parse(article)
+            parsed_date = parse_published_date(article)
             if parsed_date.tzinfo is None:
                 parsed_date = parsed_date.replace(tzinfo=dateutil_tz.UTC)
             central_date = parsed_date.astimezone(CENTRAL)
             
             metadata['date_extracted'] = True
             metadata['date_confidence'] = 1.0
-            return central_date.strftime("%B %d, %Y"), metadata
+            return central_date.strftime(DISPLAY_DATE_FORMAT), metadata
             
         except Exception as e:
             logger.warning(f"Date parsing error: {e}")
@@ -119,14 +168,11 @@ def format_date(article: Union[Dict, str]) -> Tuple[str, Dict]:
         
         # Use current date as fallback
         logger.warning("No date found, using current date")
-        return datetime.now(CENTRAL).strftime("%B %d, %Y"), metadata
+        return datetime.now(CENTRAL).strftime(DISPLAY_DATE_FORMAT), metadata
     
     try:
         # Parse the provided date
-        if isinstance(date_str, datetime):
-            parsed_date = date_str
-        else:
-            parsed_date = parser.parse(date_str)
+        parsed_date = parse_published_date(date_str)
         
         # Ensure timezone awareness
         if parsed_date.tzinfo is None:
@@ -135,7 +181,7 @@ def format_date(article: Union[Dict, str]) -> Tuple[str, Dict]:
         
         metadata['date_extracted'] = True
         metadata['date_confidence'] = 1.0
-        return central_date.strftime("%B %d, %Y"), metadata
+        return central_date.strftime(DISPLAY_DATE_FORMAT), metadata
         
     except Exception as e:
         logger.warning(f"Date parsing error: {e}")
@@ -144,11 +190,11 @@ def format_date(article: Union[Dict, str]) -> Tuple[str, Dict]:
 def format_extracted_date(date_str: str) -> str:
     """Format an extracted date string consistently."""
     try:
-        parsed_date = parser.parse(date_str)
+        parsed_date = parse_published_date(date_str)
         if parsed_date.tzinfo is None:
             parsed_date = parsed_date.replace(tzinfo=dateutil_tz.UTC)
-        return parsed_date.astimezone(CENTRAL).strftime("%B %d, %Y")
-    except:
+        return parsed_date.astimezone(CENTRAL).strftime(DISPLAY_DATE_FORMAT)
+    except (TypeError, ValueError, OverflowError):
         return date_str
 
 def filter_articles_by_date(articles: List[Dict], 
@@ -185,19 +231,19 @@ def filter_articles_by_date(articles: List[Dict],
             continue
 
         try:
-            publish_date = parser.parse(formatted_date)
-            if publish_date.tzinfo is None:
-                publish_date = publish_date.replace(tzinfo=CENTRAL)
-            
-            # Apply date filters
-            if start_date and publish_date < start_date:
-                continue
-            if end_date and publish_date > end_date:
-                continue
-            filtered_articles.append(article)
-            
-        except Exception as e:
+            # Dates format_date could parse come back in DISPLAY_DATE_FORMAT, so
+            # read them with strptime; any other string (e.g. a raw date that
+            # format_extracted_date passed through) fails here and is skipped
+            publish_date = datetime.strptime(formatted_date, DISPLAY_DATE_FORMAT).replace(tzinfo=CENTRAL)
+        except ValueError as e:
             logger.warning(f"Error filtering article by date: {e}")
             continue
 
+        # Apply date filters
+        if start_date and publish_date < start_date:
+            continue
+        if end_date and publish_date > end_date:
+            continue
+        filtered_articles.append(article)
+
     return filtered_articles
\ No newline at end of file
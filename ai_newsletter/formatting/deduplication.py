@@ -1,11 +1,24 @@
 """Article deduplication utilities."""
 from typing import List, Dict
-import re
+from collections import defaultdict
+from functools import lru_cache
 from difflib import SequenceMatcher
 from ai_newsletter.logging_cfg.logger import setup_logger
 
 logger = setup_logger()
 
+@lru_cache(maxsize=8192)
+def normalize_text(text: str) -> str:
+    """Lowercase text and collapse whitespace, caching repeat inputs."""
+    if not text:
+        return ""
+    return " ".join(text.lower().split())
+
+def get_source_name(article: Dict) -> str:
+    """Return the source name whether the source is a GNews dict or a plain string."""
+    source = article.get('source', '')
+    return source.get('name', '') if isinstance(source, dict) else str(source)
+
 def is_duplicate(article1: Dict, article2: Dict, title_threshold: float = 0.8) -> bool:
     """
     Detect duplicate articles using GNews metadata.
@@ -18,16 +31,17 @@ def is_duplicate(article1: Dict, article2: Dict, title_threshold: float = 0.8) -
     Returns:
         True if articles are likely duplicates, False otherwise
     """
-    def normalize_text(text):
-        if not text:
-            return ""
-        return re.sub(r'\s+', ' ', text.lower().strip())
-    
-    title1 = normalize_text(article1.get('title', ''))
-    title2 = normalize_text(article2.get('title', ''))
-    desc1 = normalize_text(article1.get('description', ''))
-    desc2 = normalize_text(article2.get('description', ''))
-    
+    return _is_duplicate_normalized(
+        normalize_text(article1.get('title', '')),
+        normalize_text(article1.get('description', '')),
+        normalize_text(article2.get('title', '')),
+        normalize_text(article2.get('description', '')),
+        title_threshold
+    )
+
+def _is_duplicate_normalized(title1: str, desc1: str, title2: str, desc2: str,
+                             title_threshold: float = 0.8) -> bool:
+    """Compare already-normalized titles and descriptions for duplication."""
     # If either title is empty, we can't reliably compare
     if not title1 or not title2:
         return False
@@ -36,18 +50,26 @@ def is_duplicate(article1: Dict, article2: Dict, title_threshold: float = 0.8) -
     if title1 == title2:
         return True
     
-    # Calculate title similarity
-    title_similarity = SequenceMatcher(None, title1, title2).ratio()
-    
     # If titles are very similar, check description if available
-    if title_similarity > title_threshold:
+    if _similarity_exceeds(title1, title2, title_threshold):
         if desc1 and desc2:
-            desc_similarity = SequenceMatcher(None, desc1, desc2).ratio()
-            return desc_similarity > 0.6
+            return _similarity_exceeds(desc1, desc2, 0.6)
         return True
     
     return False
 
+def _similarity_exceeds(text1: str, text2: str, threshold: float) -> bool:
+    """
+    Check whether SequenceMatcher similarity is above threshold.
+    
+    real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio(),
+    so most dissimilar pairs are rejected without the full comparison.
+    """
+    matcher = SequenceMatcher(None, text1, text2)
+    return (matcher.real_quick_ratio() > threshold
+            and matcher.quick_ratio() > threshold
+            and matcher.ratio() > threshold)
+
 def limit_articles_by_source(articles: List[Dict], max_per_source: int = 3) -> List[Dict]:
     """
     Limit the number of articles from each source to prevent one source dominating.
@@ -63,15 +85,9 @@ def limit_articles_by_source(articles: List[Dict], max_per_source: int = 3) -> L
         return []
     
     # Group articles by source
-    source_groups = {}
+    source_groups = defaultdict(list)
     for article in articles:
-        source = article.get('source', {})
-        source_name = source.get('name', source) if isinstance(source, dict) else str(source)
-        if not source_name:
-            source_name = 'Unknown'
-            
-        if source_name not in source_groups:
-            source_groups[source_name] = []
+        source_name = get_source_name(article) or 'Unknown'
         source_groups[source_name].append(article)
     
     # Sort each group by date (newest first)
@@ -134,7 +150,7 @@ def deduplicate_articles(articles: List[Dict]) -> List[Dict]:
     sorted_articles = sorted(
         articles, 
         key=lambda a: (
-            source_preference.get(a.get('source', ''), default_preference),
+            source_preference.get(get_source_name(a), default_preference),
             a.get('published', '0')  # Default to '0' if no date
         ),
         reverse=True
@@ -142,46 +158,53 @@ def deduplicate_articles(articles: List[Dict]) -> List[Dict]:
     
     unique_articles = []
     duplicate_count = 0
-    duplicate_groups = []
-    seen_urls = set()
+    # Map URLs and normalized titles to the index of the kept article
+    seen_urls = {}
+    seen_titles = {}
+    # Normalized (title, description) of each kept article, computed once
+    unique_keys = []
     
-    # Track duplicate groups for reporting
-    current_duplicates = []
+    # Duplicate titles grouped under the index of the article they matched
+    duplicate_groups = defaultdict(list)
     
     for article in sorted_articles:
-        is_dup = False
         url = article.get('url', article.get('link', ''))
         
         # Check if this URL has been seen before
         if url and url in seen_urls:
-            is_dup = True
             duplicate_count += 1
-            current_duplicates.append(article.get('title', 'No title'))
+            duplicate_groups[seen_urls[url]].append(article.get('title', 'No title'))
             logger.debug(f"Duplicate URL found: {url}")
             continue
         
+        # Exact title matches are always duplicates; catch them with a dict
+        # lookup before falling back to the pairwise similarity scan
+        title_key = normalize_text(article.get('title', ''))
+        desc_key = normalize_text(article.get('description', ''))
+        if title_key and title_key in seen_titles:
+            duplicate_count += 1
+            duplicate_groups[seen_titles[title_key]].append(article.get('title', 'No title'))
+            continue
+        
         # Check for content similarity with existing articles
-        for existing in unique_articles:
-            if is_duplicate(article, existing):
-                is_dup = True
-                duplicate_count += 1
-                current_duplicates.append(article.get('title', 'No title'))
-                break
+        match_index = next(
+            (index for index, (existing_title, existing_desc) in enumerate(unique_keys)
+             if _is_duplicate_normalized(title_key, desc_key, existing_title, existing_desc)),
+            None
+        )
+        if match_index is not None:
+            duplicate_count += 1
+            duplicate_groups[match_index].append(article.get('title', 'No title'))
+            continue
         
-        if not is_dup:
-            # If we were tracking duplicates, finish the group
-            if current_duplicates:
-                duplicate_groups.append(current_duplicates)
-                current_duplicates = []
-            
-            # Add to seen URLs and unique articles
-            if url:
-                seen_urls.add(url)
-            unique_articles.append(article)
-    
-    # Add the last group if it exists
-    if current_duplicates:
-        duplicate_groups.append(current_duplicates)
+        # Add to seen URLs and unique articles
+        index = len(unique_articles)
+        if url:
+            seen_urls[url] = index
+        if title_key:
+            seen_titles[title_key] = index
+        unique_articles.append(article)
+        unique_keys.append((title_key, desc_key))
     
     # Log deduplication results
     logger.info(f"Deduplication removed {duplicate_count} duplicate articles")
@@ -190,9 +213,10 @@ def deduplicate_articles(articles: List[Dict]) -> List[Dict]:
     # Log duplicate groups (limited to first 5 for brevity)
     if duplicate_groups:
         logger.debug(f"Found {len(duplicate_groups)} duplicate groups:")
-        for i, group in enumerate(duplicate_groups[:5], 1):
-            logger.debug(f"Group {i}: {', '.join(group)}")
+        for i, (index, group) in enumerate(list(duplicate_groups.items())[:5], 1):
+            kept_title = unique_articles[index].get('title', 'No title')
+            logger.debug(f"Group {i}: kept '{kept_title}', dropped {', '.join(group)}")
         if len(duplicate_groups) > 5:
             logger.debug(f"... and {len(duplicate_groups) - 5} more groups")
     
-    return unique_articles
\ No newline at end of file
+    return unique_articles
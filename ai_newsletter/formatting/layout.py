@@ -1,11 +1,12 @@
 """Newsletter layout and styling."""
 from typing import List
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 from ai_newsletter.core.types import Article
 
-def wrap_with_css(content: str) -> str:
-    """Wrap content with HTML head and CSS styles."""
-    return f"""
+# Static document shell; content is spliced between head and tail, so the
+# stylesheet is built once at import rather than formatted on every call
+_HTML_HEAD = """
     <!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
     <html xmlns="http://www.w3.org/1999/xhtml">
     <head>
@@ -14,7 +15,7 @@ def wrap_with_css(content: str) -> str:
         <title>Your Daily News Summary</title>
         <style type="text/css">
             /* Base styles */
-            body {{
+            body {
                 margin: 0;
                 padding: 0;
                 min-width: 100%;
@@ -23,95 +24,95 @@ def wrap_with_css(content: str) -> str:
                 color: #1a202c;
                 background-color: #f8fafc;
                 -webkit-font-smoothing: antialiased;
-            }}
+            }
 
             /* Email container */
-            .email-wrapper {{
+            .email-wrapper {
                 width: 100%;
                 margin: 0;
                 padding: 20px;
                 background-color: #f8fafc;
-            }}
+            }
             
-            .email-content {{
+            .email-content {
                 max-width: 600px;
                 margin: 0 auto;
-            }}
+            }
 
             /* Header styles */
-            .header {{
+            .header {
                 text-align: center;
                 padding: 24px;
                 background-color: #ffffff;
                 border-radius: 8px;
                 margin-bottom: 24px;
                 box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 margin: 0;
                 font-size: 24px;
                 font-weight: 600;
                 color: #1a202c;
-            }}
+            }
 
-            .date {{
+            .date {
                 margin-top: 8px;
                 color: #64748b;
                 font-size: 14px;
-            }}
+            }
 
             /* Digest content */
-            .digest {{
+            .digest {
                 background-color: #ffffff;
                 border-radius: 8px;
                 padding: 24px;
                 margin-bottom: 24px;
                 box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
-            }}
+            }
 
-            .digest h2 {{
+            .digest h2 {
                 margin: 0 0 24px 0;
                 font-size: 20px;
                 font-weight: 600;
                 color: #1a202c;
                 padding-bottom: 16px;
                 border-bottom: 1px solid #e2e8f0;
-            }}
+            }
 
             /* Article styling */
-            .article {{
+            .article {
                 padding: 20px 0;
                 border-bottom: 1px solid #e2e8f0;
-            }}
+            }
 
-            .article:last-child {{
+            .article:last-child {
                 border-bottom: none;
                 padding-bottom: 0;
-            }}
+            }
 
-            .article-title {{
+            .article-title {
                 margin: 0 0 8px 0;
                 font-size: 16px;
                 font-weight: 600;
                 color: #1a202c;
                 line-height: 1.4;
-            }}
+            }
 
-            .article-meta {{
+            .article-meta {
                 font-size: 14px;
                 color: #64748b;
                 margin-bottom: 12px;
-            }}
+            }
 
-            .read-more {{
+            .read-more {
                 color: #3b82f6;
                 text-decoration: none;
                 font-weight: 500;
-            }}
+            }
 
             /* Tags styling */
-            .tag {{
+            .tag {
                 display: inline-block;
                 padding: 2px 8px;
                 margin: 0 4px 4px 0;
@@ -119,44 +120,44 @@ def wrap_with_css(content: str) -> str:
                 background-color: #f1f5f9;
                 color: #475569;
                 font-size: 12px;
-            }}
+            }
 
             /* Bullet points */
-            .takeaway-bullets {{
+            .takeaway-bullets {
                 margin: 12px 0 0 0;
                 padding-left: 20px;
                 list-style-type: disc;
                 color: #475569;
-            }}
+            }
 
-            .takeaway-bullets li {{
+            .takeaway-bullets li {
                 margin-bottom: 8px;
                 font-size: 14px;
                 line-height: 1.5;
-            }}
+            }
 
-            .takeaway-bullets li:last-child {{
+            .takeaway-bullets li:last-child {
                 margin-bottom: 0;
-            }}
+            }
 
             /* More stories section */
-            .more-stories {{
+            .more-stories {
                 text-align: center;
                 padding: 16px;
                 margin-top: 24px;
                 border-top: 1px solid #e2e8f0;
                 color: #64748b;
                 font-size: 14px;
-            }}
+            }
 
-            .more-stories a {{
+            .more-stories a {
                 color: #3b82f6;
                 text-decoration: none;
                 font-weight: 500;
-            }}
+            }
 
             /* Footer */
-            .footer {{
+            .footer {
                 text-align: center;
                 padding: 24px;
                 color: #64748b;
@@ -164,53 +165,63 @@ def wrap_with_css(content: str) -> str:
                 background-color: #ffffff;
                 border-radius: 8px;
                 box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
-            }}
+            }
 
-            .footer a {{
+            .footer a {
                 color: #3b82f6;
                 text-decoration: none;
-            }}
+            }
 
             /* Mobile optimizations */
-            @media screen and (max-width: 600px) {{
-                .email-wrapper {{
+            @media screen and (max-width: 600px) {
+                .email-wrapper {
                     padding: 12px;
-                }}
+                }
 
-                .header, .digest, .footer {{
+                .header, .digest, .footer {
                     padding: 16px;
                     margin-bottom: 16px;
-                }}
+                }
 
-                .article {{
+                .article {
                     padding: 16px 0;
-                }}
+                }
 
-                .article-title {{
+                .article-title {
                     font-size: 15px;
-                }}
+                }
 
-                .article-meta, .takeaway-bullets li {{
+                .article-meta, .takeaway-bullets li {
                     font-size: 13px;
-                }}
-            }}
+                }
+            }
         </style>
     </head>
     <body>
         <div class="email-wrapper">
             <div class="email-content">
-                {content}
+                """
+
+_HTML_TAIL = """
             </div>
         </div>
     </body>
     </html>
     """
 
+def wrap_with_css(content: str) -> str:
+    """Wrap content with HTML head and CSS styles."""
+    return _HTML_HEAD + content + _HTML_TAIL
+
+@lru_cache(maxsize=1)
+def format_header_date_range(today: date) -> str:
+    """Format the header's "yesterday - today" range, cached per calendar day."""
+    yesterday = today - timedelta(days=1)
+    return f"{yesterday.strftime('%B %d')} - {today.strftime('%B %d, %Y')}"
+
 def build_header() -> str:
     """Generate the newsletter header with date range."""
-    now = datetime.now()
-    yesterday = now - timedelta(days=1)
-    date_range = f"{yesterday.strftime('%B %d')} - {now.strftime('%B %d, %Y')}"
+    date_range = format_header_date_range(datetime.now().date())
     
     return f"""
     <div class="header">
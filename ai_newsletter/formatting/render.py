@@ -1,4 +1,5 @@
 """Article rendering and formatting functions."""
+import html as html_lib
 from typing import List, Dict, DefaultDict
 from datetime import datetime
 from collections import defaultdict
@@ -21,47 +22,9 @@ from ai_newsletter.logging_cfg.logger import setup_logger
 
 logger = setup_logger()
 
-def format_article(article: Dict, html: bool = False, max_takeaways: int = 2) -> str:
-    """Format a single article with enhanced metadata display."""
-    title = article.get('title', 'No Title')
-    url = article.get('url', '#')
-    summary = article.get('summary', '')
-    
-    # Format date and get metadata
-    date, metadata = format_date(article)
-    
-    # Get source information
-    source_data = article.get('source', {})
-    source_name = source_data.get('name', 'Unknown Source')
-    source_category = source_data.get('category', '')
-    source_reliability = source_data.get('reliability_score', None)
-    
-    # Date confidence indicator
-    date_indicator = ""
-    if not metadata['date_extracted']:
-        date_indicator = ' <span class="date-status low">(Estimated)</span>'
-    elif metadata['date_confidence'] < 0.7:
-        date_indicator = f' <span class="date-status medium">(~{metadata["date_confidence"]:.0%} confident)</span>'
-    
-    # Extract bullet points from summary
-    bullet_points = []
-    if summary:
-        sentences = [s.strip() for s in summary.split('.') if len(s.strip()) > 0]
-        # Take 1 bullet if first sentence is long, otherwise take up to max_takeaways
-        bullet_points = sentences[:1] if len(sentences[0]) > 100 else sentences[:max_takeaways]
-    
-    if html:
-        # Format bullet points if any
-        bullets_html = ""
-        if bullet_points:
-            bullets = "\n".join([f"<li>{point.strip()}.</li>" for point in bullet_points])
-            bullets_html = f'<ul class="takeaway-bullets">{bullets}</ul>'
-        
-        # Add tags with emojis
-        tags = get_personalization_tags_html(article)
-        
-        # Generate article HTML with inline styles for better email client compatibility
-        return f"""
+# Article HTML with inline styles for better email client compatibility;
+# filled with already-escaped fields via str.format_map
+ARTICLE_HTML_TEMPLATE = """
         <div class="article" style="padding: 20px 0; border-bottom: 1px solid #e2e8f0;">
             <h3 class="article-title" style="margin: 0 0 8px 0; font-size: 16px; font-weight: 600; color: #1a202c; line-height: 1.4;">{title}</h3>
             <div class="article-meta" style="font-size: 14px; color: #64748b; margin-bottom: 12px;">
@@ -74,8 +37,57 @@ def format_article(article: Dict, html: bool = False, max_takeaways: int = 2) ->
             </div>
         </div>
         """
+
+def format_article(article: Dict, html: bool = False, max_takeaways: int = 2) -> str:
+    """Format a single article with enhanced metadata display."""
+    if html:
+        return _format_article_html(article, max_takeaways)
+    return _format_article_text(article, max_takeaways)
+
+def _get_bullet_points(summary: str, max_takeaways: int) -> List[str]:
+    """Split a summary into takeaway sentences."""
+    if not summary:
+        return []
+    sentences = [s.strip() for s in summary.split('.') if len(s.strip()) > 0]
+    if not sentences:
+        return []
+    # Take 1 bullet if first sentence is long, otherwise take up to max_takeaways
+    return sentences[:1] if len(sentences[0]) > 100 else sentences[:max_takeaways]
+
+def _format_article_html(article: Dict, max_takeaways: int = 2) -> str:
+    """Render an article card; the card shows no date, so none is formatted."""
+    bullet_points = _get_bullet_points(article.get('summary', ''), max_takeaways)
+    
+    # Format bullet points if any
+    bullets_html = ""
+    if bullet_points:
+        bullets = "\n".join([f"<li>{html_lib.escape(point.strip())}.</li>" for point in bullet_points])
+        bullets_html = f'<ul class="takeaway-bullets">{bullets}</ul>'
+    
+    # Add tags with emojis
+    tags = get_personalization_tags_html(article)
+    
+    # Escape article fields so stray markup can't break the email layout
+    return ARTICLE_HTML_TEMPLATE.format_map({
+        'title': html_lib.escape(article.get('title', 'No Title')),
+        'url': html_lib.escape(article.get('url', '#')),
+        'tags': tags,
+        'bullets_html': bullets_html
+    })
+
+def _format_article_text(article: Dict, max_takeaways: int = 2) -> str:
+    """Render an article as plain text with source and date."""
+    title = article.get('title', 'No Title')
+    url = article.get('url', '#')
+    summary = article.get('summary', '')
+    
+    # Format date and get source information
+    date, _ = format_date(article)
+    source_data = article.get('source', {})
+    source_name = source_data.get('name', 'Unknown Source')
     
     # Plain text format with structured layout
+    bullet_points = _get_bullet_points(summary, max_takeaways)
     text_bullets = "\n".join([f"* {point.strip()}." for point in bullet_points])
     return f"""
 {title}
@@ -106,7 +118,7 @@ def build_newsletter(articles: List[Article]) -> str:
 
     # Build main article section
     articles_html = "\n".join([
-        format_article(a, html=True, max_takeaways=2) for a in display_articles
+        _format_article_html(a, max_takeaways=2) for a in display_articles
     ])
 
     # Add a "more articles" link if needed
@@ -1,8 +1,31 @@
 """Text processing utilities."""
 import re
-from typing import List
+from typing import Iterable, List, Pattern
 from bs4 import BeautifulSoup
 
+def compile_keyword_pattern(keywords: Iterable[str], whole_word_max_len: int = 3) -> Pattern[str]:
+    """
+    Compile keywords into one alternation that matches at the start of a word.
+    
+    Keywords match as word prefixes, so "health" still finds "healthcare".
+    Keywords no longer than whole_word_max_len must match a whole word
+    (optionally plural), so "ai" does not hit "said" or "aid".
+    
+    Args:
+        keywords: Lowercase keywords or phrases
+        whole_word_max_len: Longest keyword that must match as a whole word
+        
+    Returns:
+        Compiled pattern to search lowercased text with
+    """
+    whole_words = [re.escape(k) for k in keywords if len(k) <= whole_word_max_len]
+    prefixes = [re.escape(k) for k in keywords if len(k) > whole_word_max_len]
+    alternatives = []
+    if whole_words:
+        alternatives.append(r'(?:' + '|'.join(whole_words) + r')s?\b')
+    alternatives.extend(prefixes)
+    return re.compile(r'\b(?:' + '|'.join(alternatives) + ')')
+
 def strip_html(html: str) -> str:
     """
     Convert HTML to plain text by removing HTML tags while preserving structure.
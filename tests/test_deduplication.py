@@ -0,0 +1,44 @@
+"""Tests for newsletter article deduplication."""
+import unittest
+from ai_newsletter.formatting.deduplication import (
+    deduplicate_articles,
+    is_duplicate
+)
+
+class TestDeduplication(unittest.TestCase):
+    def test_exact_title_duplicates_removed(self):
+        """Test that articles with the same normalized title are collapsed"""
+        articles = [
+            {'title': 'Markets Rally  Again', 'url': 'https://a.com/1', 'source': 'Reuters'},
+            {'title': 'markets rally again', 'url': 'https://b.com/1', 'source': 'Other'},
+            {'title': 'Storm Hits Coast', 'url': 'https://c.com/1', 'source': 'Other'}
+        ]
+
+        deduped = deduplicate_articles(articles)
+
+        self.assertEqual(len(deduped), 2)
+        self.assertEqual(deduped[0]['source'], 'Reuters')
+
+    def test_dict_sources_use_preference(self):
+        """Test that GNews-style source dicts are ranked by source name"""
+        articles = [
+            {'title': 'Breaking News', 'url': 'https://x.com/1', 'source': {'name': 'Other Source'}},
+            {'title': 'Breaking News', 'url': 'https://ap.com/1', 'source': {'name': 'Associated Press'}}
+        ]
+
+        deduped = deduplicate_articles(articles)
+
+        self.assertEqual(len(deduped), 1)
+        self.assertEqual(deduped[0]['source']['name'], 'Associated Press')
+
+    def test_is_duplicate_similar_titles(self):
+        """Test similarity-based duplicate detection"""
+        article1 = {'title': 'Breaking News', 'url': 'https://a.com/1'}
+        article2 = {'title': 'Breaking News Story', 'url': 'https://b.com/1'}
+        article3 = {'title': 'Completely Different', 'url': 'https://c.com/1'}
+
+        self.assertTrue(is_duplicate(article1, article2))
+        self.assertFalse(is_duplicate(article1, article3))
+
+if __name__ == '__main__':
+    unittest.main()
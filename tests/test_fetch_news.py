@@ -1,10 +1,15 @@
 """Tests for news fetching functionality."""
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from ai_newsletter.feeds.fetcher import (
     fetch_articles_from_all_feeds,
-    categorize_article_age
+    categorize_article_age,
+    categorize_article_ages,
+    annotate_published_dates,
+    wait_for_request_slot
 )
 from ai_newsletter.feeds.gnews_client import GNewsAPI
 from ai_newsletter.feeds.filters import filter_articles_by_date
@@ -34,6 +39,73 @@ class TestFetchNews(unittest.TestCase):
             with self.subTest(date=date):
                 self.assertEqual(categorize_article_age(date), expected)
 
+    def test_categorize_article_age_with_reference_time(self):
+        """Test that a fixed reference time is used instead of the clock"""
+        now = datetime(2025, 4, 29, 12, 0, tzinfo=timezone.utc)
+        
+        self.assertEqual(categorize_article_age(now - timedelta(hours=5), now=now), 'Breaking')
+        self.assertEqual(categorize_article_age(now - timedelta(hours=6), now=now), 'Today')
+        self.assertEqual(categorize_article_age(now - timedelta(days=3), now=now), 'This Week')
+        # Naive dates are treated as UTC
+        self.assertEqual(categorize_article_age(datetime(2025, 4, 20, 12, 0), now=now), 'Older')
+
+    def test_categorize_article_ages_batch(self):
+        """Test that a batch is aged against one reference time"""
+        now = datetime(2025, 4, 29, 12, 0, tzinfo=timezone.utc)
+        articles = [
+            {'title': 'New', 'published_dt': now - timedelta(hours=1)},
+            {'title': 'Old', 'published_dt': now - timedelta(days=30)},
+            {'title': 'Undated'}
+        ]
+        
+        categorize_article_ages(articles, now=now)
+        
+        self.assertEqual(articles[0]['age_category'], 'Breaking')
+        self.assertEqual(articles[1]['age_category'], 'Older')
+        self.assertNotIn('age_category', articles[2])
+
+    def test_annotate_published_dates_skips_unparseable(self):
+        """Test that bad or overflowing dates are skipped instead of raising"""
+        articles = [
+            {'title': 'Good', 'published_at': '2025-04-29T12:00:00'},
+            {'title': 'Garbage', 'published_at': 'not a date'},
+            {'title': 'Overflow', 'published_at': '99999999999999999999'}
+        ]
+        
+        annotate_published_dates(articles)
+        
+        self.assertEqual(articles[0]['published_dt'], datetime(2025, 4, 29, 12, 0, tzinfo=timezone.utc))
+        self.assertNotIn('published_dt', articles[1])
+        self.assertNotIn('published_dt', articles[2])
+
+    def test_request_slots_are_spaced_across_threads(self):
+        """Test that concurrent workers start requests at least the delay apart"""
+        starts = []
+        
+        def worker():
+            wait_for_request_slot()
+            starts.append(time.monotonic())
+        
+        with patch('ai_newsletter.feeds.fetcher.GNEWS_REQUEST_DELAY', 0.05):
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        starts.sort()
+        for earlier, later in zip(starts, starts[1:]):
+            self.assertGreaterEqual(later - earlier, 0.045)
+
+    def test_is_major_story_matches_whole_country_names(self):
+        """Test that country names only count as whole words or phrases"""
+        client = GNewsAPI()
+        
+        self.assertTrue(client.is_major_story({'title': 'France and Germany sign deal', 'description': ''}))
+        self.assertTrue(client.is_major_story({'title': 'Talks in Burkina Faso', 'description': 'Mali joins'}))
+        # "oman" inside "woman" and "niger" inside "nigeria" are not extra mentions
+        self.assertFalse(client.is_major_story({'title': 'Woman wins award in Nigeria', 'description': ''}))
+
     def test_fetch_articles_metadata_handling(self):
         """Test that article metadata from GNews API is properly handled"""
         mock_articles = [
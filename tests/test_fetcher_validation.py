@@ -8,6 +8,7 @@ from ai_newsletter.feeds.filters import (
     is_duplicate,
     deduplicate_articles
 )
+from ai_newsletter.formatting.date_utils import parse_published_date
 
 class TestFetcherValidation(unittest.TestCase):
     def setUp(self):
@@ -79,6 +80,18 @@ class TestFetcherValidation(unittest.TestCase):
         self.assertEqual(len(filtered), 1)
         self.assertEqual(filtered[0]['title'], 'Recent Article')
 
+    def test_parse_published_date_formats(self):
+        """Test that ISO, RFC 822 and free-form dates parse to the same instant"""
+        expected = datetime(2025, 4, 29, 10, 0, tzinfo=timezone.utc)
+        
+        self.assertEqual(parse_published_date('2025-04-29T10:00:00Z'), expected)
+        self.assertEqual(parse_published_date('Tue, 29 Apr 2025 10:00:00 GMT'), expected)
+        self.assertEqual(parse_published_date('April 29, 2025 10:00 UTC'), expected)
+        self.assertIs(parse_published_date(expected), expected)
+        
+        with self.assertRaises(ValueError):
+            parse_published_date('not a date')
+
     def test_is_duplicate_detection(self):
         """Test duplicate article detection"""
         article1 = {
@@ -0,0 +1,101 @@
+"""Tests for newsletter article rendering."""
+import unittest
+from ai_newsletter.formatting.render import format_article
+from ai_newsletter.formatting.tags import get_tag_html, identify_tags
+from ai_newsletter.formatting.categorization import categorize_article
+from ai_newsletter.formatting.text_utils import strip_html
+from ai_newsletter.formatting.date_utils import format_extracted_date
+from ai_newsletter.email.sender import strip_html as strip_email_html
+
+class TestFormatArticle(unittest.TestCase):
+    def test_html_escapes_article_fields(self):
+        """Test that markup in titles, URLs and summaries is escaped"""
+        article = {
+            'title': 'Stocks <b>soar</b> & bonds fall',
+            'url': 'https://example.com/a?x=1&y="2"',
+            'summary': 'Prices rose <script>alert(1)</script> sharply. Markets closed higher.',
+            'source': {'name': 'Reuters'}
+        }
+
+        html = format_article(article, html=True)
+
+        self.assertIn('Stocks &lt;b&gt;soar&lt;/b&gt; &amp; bonds fall', html)
+        self.assertIn('href="https://example.com/a?x=1&amp;y=&quot;2&quot;"', html)
+        self.assertNotIn('<script>', html)
+        self.assertNotIn('<b>soar</b>', html)
+
+    def test_text_format_is_unescaped(self):
+        """Test that the plain text version keeps the original characters"""
+        article = {
+            'title': 'Q&A: What <next>?',
+            'url': 'https://example.com/qa',
+            'summary': 'A short answer.',
+            'source': {'name': 'NPR'}
+        }
+
+        text = format_article(article, html=False)
+
+        self.assertIn('Q&A: What <next>?', text)
+        self.assertIn('Source: NPR', text)
+
+class TestTagHtml(unittest.TestCase):
+    def test_tag_label_is_escaped(self):
+        """Test that tag labels from article data cannot inject markup"""
+        self.assertEqual(
+            get_tag_html('R&D <Labs>', '🔬'),
+            '<span class="tag">🔬 R&amp;D &lt;Labs&gt;</span>'
+        )
+
+    def test_known_tag_uses_default_emoji(self):
+        """Test that a tag without an explicit emoji falls back to TAG_EMOJIS"""
+        self.assertEqual(get_tag_html('Science'), '<span class="tag">🔬 Science</span>')
+
+class TestKeywordMatching(unittest.TestCase):
+    def test_tags_match_whole_words(self):
+        """Test that short keywords do not match inside longer words"""
+        self.assertEqual(identify_tags({'title': 'He said the lawn needs work', 'description': ''}), [])
+        self.assertEqual(
+            sorted(identify_tags({'title': 'AI tutors for students', 'description': ''})),
+            ['Education', 'Technology']
+        )
+
+    def test_categories_match_whole_words(self):
+        """Test that source and content keywords only match whole words"""
+        self.assertEqual(categorize_article({'title': 'Product launch', 'source': {'name': 'AppleInsider'}}), 'US_NEWS')
+        self.assertEqual(categorize_article({'title': 'Markets rally', 'source': {'name': 'AP News'}}), 'CENTER')
+        self.assertEqual(categorize_article({'title': 'New apps ship', 'source': {'name': 'Blog'}}), 'TECHNOLOGY')
+
+    def test_tags_match_word_prefixes(self):
+        """Test that inflected and compound words still pick up their tags"""
+        cases = {
+            'Healthcare costs soar': ['Healthcare'],
+            'Lawmakers pass bill': ['Legal'],
+            'Environmental rules tighten': ['Environment'],
+            'Researchers find': ['Science'],
+            'Worldwide outage': ['Global'],
+            'Aid groups aim for clean air': []
+        }
+        for title, expected in cases.items():
+            with self.subTest(title=title):
+                self.assertEqual(sorted(identify_tags({'title': title, 'description': ''})), expected)
+
+    def test_sources_match_brand_prefixes(self):
+        """Test that source names match as brand prefixes"""
+        self.assertEqual(categorize_article({'title': 'Storm update', 'source': {'name': 'ABC7 Chicago'}}), 'CENTER')
+        self.assertEqual(categorize_article({'title': 'Storm update', 'source': {'name': 'NYTimes'}}), 'LEFT_LEANING')
+
+class TestStripHtml(unittest.TestCase):
+    def test_fragment_text_is_not_repeated(self):
+        """Test that HTML fragments come back with their text exactly once"""
+        self.assertEqual(strip_html('<p>Hello world</p>'), 'Hello world')
+        self.assertEqual(strip_email_html('Just a sentence.'), 'Just a sentence.')
+
+class TestFormatExtractedDate(unittest.TestCase):
+    def test_unparseable_input_is_returned_unchanged(self):
+        """Test that bad strings and non-string metadata values pass through"""
+        self.assertEqual(format_extracted_date('not a date'), 'not a date')
+        self.assertIsNone(format_extracted_date(None))
+        self.assertEqual(format_extracted_date(20250429), 20250429)
+
+if __name__ == '__main__':
+    unittest.main()